@@ -0,0 +1,40 @@
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+__all__ = (
+    'NUMBA_AVAILABLE',
+    'bernoulli_score'
+)
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def bernoulli_score(X: np.ndarray, log_fp: np.ndarray,
+                        log_1mfp: np.ndarray, log_prior: np.ndarray) -> np.ndarray:
+        n_samples, n_features = X.shape
+        n_classes = log_fp.shape[0]
+        scores = np.empty((n_samples, n_classes))
+
+        for i in prange(n_samples):
+            for c in range(n_classes):
+                score = log_prior[c]
+                for j in range(n_features):
+                    feature = X[i, j]
+                    score += feature * log_fp[c, j]
+                    score += (1.0 - feature) * log_1mfp[c, j]
+                scores[i, c] = score
+
+        return scores
+
+else:
+
+    def bernoulli_score(X: np.ndarray, log_fp: np.ndarray,
+                        log_1mfp: np.ndarray, log_prior: np.ndarray) -> np.ndarray:
+        raise NotImplementedError("Numba is not installed.")
@@ -1,8 +1,10 @@
 from typing import Any
+from scipy.linalg import solve_triangular
 import numpy as np
 
-from luma.interface.util import Matrix
+from luma.interface.util import Matrix, parallel_apply
 from luma.interface.exception import NotFittedError
+from luma.classifier._naive_bayes_numba import NUMBA_AVAILABLE, bernoulli_score
 from luma.interface.super import Estimator, Evaluator, Supervised
 from luma.metric.classification import Accuracy
 
@@ -16,79 +18,82 @@ __all__ = (
 class GaussianNaiveBayes(Estimator, Supervised):
     
     """
-    Gaussian Naive Bayes is a probabilistic classification algorithm. 
-    It's based on Bayes' theorem and makes an assumption 
+    Gaussian Naive Bayes is a probabilistic classification algorithm.
+    It's based on Bayes' theorem and makes an assumption
     that the features follow a Gaussian distribution.
+
+    Parameters
+    ----------
+    `n_jobs` : Number of threads prediction is split across
+
     """
 
-    def __init__(self) -> None:
+    def __init__(self, n_jobs: int = None) -> None:
+        self.n_jobs = n_jobs
         self._fitted = False
     
     def fit(self, X: Matrix, y: Matrix) -> 'GaussianNaiveBayes':
-        self.classes = np.unique(y)
+        self.classes, counts = np.unique(y, return_counts=True)
         self.parameters = []
-        self.priors = []
         self.X_train = X
         self.y_train = y
+        self._log_prior = np.log(counts / counts.sum())
         
+        order = np.argsort(y, kind='stable')
+        X_sorted = X[order]
+        splits = np.searchsorted(y[order], self.classes, side='right')
+
         shared_cov_matrix = np.zeros((X.shape[1], X.shape[1]))
-        for c in self.classes:
-            X_c = X[y == c]
+        lo = 0
+        for hi in splits:
+            X_c = X_sorted[lo:hi]
             cov_matrix = np.diag(X_c.var(axis=0))
             shared_cov_matrix += cov_matrix
             self.parameters.append([X_c.mean(axis=0), cov_matrix])
+            lo = hi
         
         for params in self.parameters:
             params[1] = shared_cov_matrix / len(self.classes)
-        
+
+        shared_cov = self.parameters[0][1]
+        self._means = np.stack([params[0] for params in self.parameters])
+        self._L = np.linalg.cholesky(shared_cov)
+        self._log_det = 2 * np.log(np.diag(self._L)).sum()
+
         self._fitted = True
         return self
-        
-    def _calculate_likelihood(self, x: Matrix, mean: Matrix, 
-                              cov: Matrix) -> float:
-        dim = len(mean)
-        dev = x - mean
-        cov_inv = np.linalg.inv(cov)
-        exponent = -0.5 * np.dot(dev, np.dot(cov_inv, dev))
-        norm_term = 1 / np.sqrt((2 * np.pi) ** dim * np.linalg.det(cov))
-        return norm_term * np.exp(exponent)
-
-    def _calculate_prior(self, c: Any) -> float:
-        return np.mean(self.y_train == c)
-
-    def _classify_sample(self, x: Matrix) -> Any:
-        posteriors = []
-        for i, c in enumerate(self.classes):
-            prior = self._calculate_prior(c)
-            likelihood = self._calculate_likelihood(x, *self.parameters[i])
-            posterior = prior * likelihood
-            posteriors.append(posterior)
-        return self.classes[np.argmax(posteriors)]
+
+    def _log_posterior(self, X: Matrix) -> Matrix:
+        dim = self._means.shape[1]
+        dev = X[:, np.newaxis, :] - self._means
+        Z = solve_triangular(self._L, dev.reshape(-1, dim).T, lower=True)
+        quad = (Z * Z).sum(axis=0).reshape(X.shape[0], -1)
+        return -0.5 * (quad + dim * np.log(2 * np.pi) + self._log_det) + self._log_prior
+
+    def _predict_block(self, X: Matrix) -> Matrix:
+        return self.classes[np.argmax(self._log_posterior(X), axis=1)]
+
+    def _predict_proba_block(self, X: Matrix) -> Matrix:
+        log_posteriors = self._log_posterior(X)
+        log_posteriors -= log_posteriors.max(axis=1, keepdims=True)
+        posteriors = np.exp(log_posteriors)
+        return posteriors / posteriors.sum(axis=1, keepdims=True)
 
     def predict(self, X: Matrix) -> Matrix:
         if not self._fitted: raise NotFittedError(self)
-        return np.array([self._classify_sample(x) for x in X])
+        return parallel_apply(self._predict_block, X, self.n_jobs)
 
     def predict_proba(self, X: Matrix) -> Matrix:
         if not self._fitted: raise NotFittedError(self)
-        probabilities = []
-        for x in X:
-            posteriors = []
-            for i, c in enumerate(self.classes):
-                prior = self._calculate_prior(c)
-                likelihood = self._calculate_likelihood(x, *self.parameters[i])
-                posterior = prior * likelihood
-                posteriors.append(posterior)
-            posteriors = np.array(posteriors)
-            probabilities.append(posteriors / np.sum(posteriors))          
-        return np.array(probabilities)
+        return parallel_apply(self._predict_proba_block, X, self.n_jobs)
     
     def score(self, X: Matrix, y: Matrix, 
               metric: Evaluator = Accuracy) -> float:
         X_pred = self.predict(X)
         return metric.compute(y_true=y, y_pred=X_pred)
 
-    def set_params(self) -> None: ...
+    def set_params(self, n_jobs: int = None) -> None:
+        if n_jobs is not None: self.n_jobs = int(n_jobs)
 
 
 class BernoulliNaiveBayes(Estimator, Supervised):
@@ -108,43 +113,72 @@ class BernoulliNaiveBayes(Estimator, Supervised):
         self.class_probs = np.zeros(len(self.classes))
         self.feature_probs = np.zeros((len(self.classes), X.shape[1]))
 
-        for i, c in enumerate(self.classes):
-            X_cls = X[y == c]
+        order = np.argsort(y, kind='stable')
+        X_sorted = X[order]
+        splits = np.searchsorted(y[order], self.classes, side='right')
+
+        lo = 0
+        for i, hi in enumerate(splits):
+            X_cls = X_sorted[lo:hi]
             self.class_probs[i] = len(X_cls) / len(y)
             self.feature_probs[i] = (X_cls.sum(axis=0) + 1) / (len(X_cls) + 2)
-        
+            lo = hi
+
+        self._log_prior = np.log(self.class_probs)
+        self._log_fp = np.log(self.feature_probs)
+        self._log_1mfp = np.log1p(-self.feature_probs)
+
+        self._byte_table = None
         self._fitted = True
         return self
 
+    def _build_byte_table(self) -> None:
+        weights = self._log_fp - self._log_1mfp
+        self._base_score = self._log_1mfp.sum(axis=1) + self._log_prior
+
+        n_classes, n_features = weights.shape
+        n_bytes = -(-n_features // 8)
+        padded = np.zeros((n_classes, n_bytes * 8))
+        padded[:, :n_features] = weights
+
+        byte_bits = np.unpackbits(np.arange(256, dtype=np.uint8)[:, np.newaxis], axis=1)
+        self._byte_table = np.einsum('bk,cgk->gbc', byte_bits,
+                                     padded.reshape(n_classes, n_bytes, 8))
+
+    def _packed_log_likelihood(self, X: Matrix) -> Matrix:
+        if self._byte_table is None: self._build_byte_table()
+        packed = np.packbits(np.asarray(X, dtype=np.uint8), axis=1)
+        scores = self._byte_table[np.arange(packed.shape[1]), packed].sum(axis=1)
+        return scores + self._base_score
+
+    def _joint_log_likelihood(self, X: Matrix) -> Matrix:
+        if X.dtype in (np.bool_, np.uint8):
+            return self._packed_log_likelihood(X)
+
+        log_fp, log_1mfp = self._log_fp, self._log_1mfp
+        log_prior = self._log_prior
+        if X.dtype == np.float32:
+            log_fp = log_fp.astype(np.float32)
+            log_1mfp = log_1mfp.astype(np.float32)
+
+        if NUMBA_AVAILABLE:
+            X = np.ascontiguousarray(np.asarray(X))
+            return bernoulli_score(X, log_fp, log_1mfp, log_prior)
+
+        scores = X @ log_fp.T + (1 - X) @ log_1mfp.T
+        return scores + log_prior
+
     def predict(self, X: Matrix) -> Matrix:
         if not self._fitted: raise NotFittedError(self)
-        predictions = []
-        for x in X:
-            class_scores = np.zeros(len(self.classes))
-            for i, _ in enumerate(self.classes):
-                class_scores[i] = np.log(self.class_probs[i])
-                for j, feature in enumerate(x):
-                    if feature == 1: class_scores[i] += np.log(self.feature_probs[i, j])
-                    else: class_scores[i] += np.log(1 - self.feature_probs[i, j])
-
-            predicted_class = self.classes[np.argmax(class_scores)]
-            predictions.append(predicted_class)
-        return np.array(predictions)
+        scores = self._joint_log_likelihood(X)
+        return self.classes[np.argmax(scores, axis=1)]
 
     def predict_proba(self, X: Matrix) -> Matrix:
         if not self._fitted: raise NotFittedError(self)
-        probas = []
-        for x in X:
-            class_probs = np.zeros(len(self.classes))
-            for i, _ in enumerate(self.classes):
-                class_probs[i] = np.log(self.class_probs[i])
-                for j, feature in enumerate(x):
-                    if feature == 1: class_probs[i] += np.log(self.feature_probs[i, j])
-                    else: class_probs[i] += np.log(1 - self.feature_probs[i, j])
-
-            exp_class_probs = np.exp(class_probs - np.max(class_probs))
-            probas.append(exp_class_probs / exp_class_probs.sum())
-        return np.array(probas)
+        scores = self._joint_log_likelihood(X)
+        scores -= scores.max(axis=1, keepdims=True)
+        probas = np.exp(scores)
+        return probas / probas.sum(axis=1, keepdims=True)
     
     def score(self, X: Matrix, y: Matrix, 
               metric: Evaluator = Accuracy) -> float:
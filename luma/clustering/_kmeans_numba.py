@@ -0,0 +1,88 @@
+from functools import lru_cache
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+__all__ = (
+    'NUMBA_AVAILABLE',
+    'lloyd_step'
+)
+
+_SPECIALIZE_MAX_CLUSTERS = 16
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _lloyd_step_generic(X: np.ndarray, centroids: np.ndarray) -> tuple:
+        n, dim = X.shape
+        n_clusters = centroids.shape[0]
+        labels = np.empty(n, dtype=np.int64)
+
+        for i in prange(n):
+            best, best_dist = 0, np.inf
+            for c in range(n_clusters):
+                dist = 0.0
+                for d in range(dim):
+                    diff = X[i, d] - centroids[c, d]
+                    dist += diff * diff
+                if dist < best_dist: best_dist, best = dist, c
+            labels[i] = best
+
+        sums = np.zeros((n_clusters, dim))
+        counts = np.zeros(n_clusters, dtype=np.int64)
+        for i in range(n):
+            c = labels[i]
+            counts[c] += 1
+            for d in range(dim):
+                sums[c, d] += X[i, d]
+
+        return labels, sums, counts
+
+    @lru_cache(maxsize=None)
+    def _lloyd_step_for(n_clusters: int):
+        # Baking the cluster count into the closure makes it a
+        # compile-time constant, so LLVM can unroll the centroid loop
+        # and keep the distance accumulators in registers.
+        @njit(parallel=True, fastmath=True)
+        def step(X: np.ndarray, centroids: np.ndarray) -> tuple:
+            n, dim = X.shape
+            labels = np.empty(n, dtype=np.int64)
+
+            for i in prange(n):
+                best, best_dist = 0, np.inf
+                for c in range(n_clusters):
+                    dist = 0.0
+                    for d in range(dim):
+                        diff = X[i, d] - centroids[c, d]
+                        dist += diff * diff
+                    if dist < best_dist: best_dist, best = dist, c
+                labels[i] = best
+
+            sums = np.zeros((n_clusters, dim))
+            counts = np.zeros(n_clusters, dtype=np.int64)
+            for i in range(n):
+                c = labels[i]
+                counts[c] += 1
+                for d in range(dim):
+                    sums[c, d] += X[i, d]
+
+            return labels, sums, counts
+
+        return step
+
+    def lloyd_step(X: np.ndarray, centroids: np.ndarray) -> tuple:
+        n_clusters = centroids.shape[0]
+        if n_clusters <= _SPECIALIZE_MAX_CLUSTERS:
+            return _lloyd_step_for(n_clusters)(X, centroids)
+        return _lloyd_step_generic(X, centroids)
+
+else:
+
+    def lloyd_step(X: np.ndarray, centroids: np.ndarray) -> tuple:
+        raise NotImplementedError("Numba is not installed.")
@@ -1,19 +1,46 @@
 import numpy as np
 
-from luma.interface.util import Matrix
+from luma.interface.util import Matrix, parallel_apply
 from luma.interface.exception import NotFittedError
+from luma.clustering._kmeans_numba import NUMBA_AVAILABLE, lloyd_step
 from luma.interface.super import Estimator, Evaluator, Unsupervised
 from luma.metric.clustering import SilhouetteCoefficient
 
 
 __all__ = (
-    'KMeansClustering', 
-    'KMeansClusteringPlus', 
-    'KMediansClustering', 
+    'KMeansClustering',
+    'KMeansClusteringPlus',
+    'KMediansClustering',
     'MiniBatchKMeansClustering'
 )
 
 
+def _as_float(X: Matrix) -> Matrix:
+    # Cluster assignment only compares distances, so anything that is not
+    # explicitly float64 is run through the narrower float32 BLAS path.
+    X = np.asarray(X)
+    if X.dtype != np.float64: return np.ascontiguousarray(X, dtype=np.float32)
+    return np.ascontiguousarray(X)
+
+
+def _sqdist(X: Matrix, C: Matrix, X2: Matrix = None) -> Matrix:
+    X, C = np.asarray(X), np.asarray(C)
+    if X2 is None: X2 = (X * X).sum(axis=1)
+    C2 = (C * C).sum(axis=1)
+    return X2[:, np.newaxis] + C2[np.newaxis, :] - 2 * (X @ C.T)
+
+
+def _l1_dist_blocked(X: Matrix, M: Matrix, block: int = 4096) -> Matrix:
+    X, M = np.asarray(X), np.asarray(M)
+    dists = np.empty((X.shape[0], M.shape[0]))
+    for start in range(0, X.shape[0], block):
+        chunk = X[start:start + block]
+        for k in range(M.shape[0]):
+            dists[start:start + block, k] = np.abs(chunk - M[k]).sum(axis=1)
+
+    return dists
+
+
 class KMeansClustering(Estimator, Unsupervised):
     
     """
@@ -27,60 +54,84 @@ class KMeansClustering(Estimator, Unsupervised):
     ----------
     `n_clusters` : Number of clusters
     `max_iter` : Number of iteration
-    
+    `tol` : Relative tolerance on centroid movement for early stopping
+    `n_jobs` : Number of threads prediction is split across
+
     """
-    
-    def __init__(self, 
-                 n_clusters: int = None, 
-                 max_iter: int = 100, 
+
+    def __init__(self,
+                 n_clusters: int = None,
+                 max_iter: int = 100,
+                 tol: float = 1e-4,
+                 n_jobs: int = None,
                  verbose: bool = False) -> None:
         self.n_clusters = n_clusters
         self.max_iter = max_iter
+        self.tol = tol
+        self.n_jobs = n_jobs
         self.verbose = verbose
         self._X = None
         self._fitted = False
     
     def fit(self, X: Matrix) -> 'KMeansClustering':
         init_indices = np.random.choice(X.shape[0], self.n_clusters, replace=False)
-        self.centroids = X[init_indices]
         self._X = X
-        
+
+        X = _as_float(X)
+        self.centroids = X[init_indices]
+
+        X2 = (X * X).sum(axis=1)
         for i in range(self.max_iter):
-            distances = np.linalg.norm(X[:, np.newaxis] - self.centroids, axis=2)
-            labels = np.argmin(distances, axis=1)
-            
-            new_centroids = [X[labels == i].mean(axis=0) for i in range(self.n_clusters)]
-            if np.all(np.array(new_centroids) == self.centroids): 
+            if NUMBA_AVAILABLE:
+                labels, sums, counts = lloyd_step(X, self.centroids)
+            else:
+                distances = _sqdist(X, self.centroids, X2)
+                labels = np.argmin(distances, axis=1)
+
+                sums = np.zeros((self.n_clusters, X.shape[1]))
+                np.add.at(sums, labels, X)
+                counts = np.bincount(labels, minlength=self.n_clusters)
+
+            new_centroids = sums / np.maximum(counts, 1)[:, np.newaxis]
+            new_centroids = new_centroids.astype(X.dtype, copy=False)
+            new_centroids[counts == 0] = self.centroids[counts == 0]
+
+            delta = new_centroids - self.centroids
+            if (delta * delta).sum() <= \
+                self.tol * self.tol * (self.centroids * self.centroids).sum():
                 if self.verbose: print(f'[K-Means] Ealry convergence at itertaion {i}')
                 break
-            
-            if self.verbose and i % 10 == 0: 
-                diff_norm = np.linalg.norm(np.array(new_centroids) - np.array(self.centroids))
+
+            if self.verbose and i % 10 == 0:
+                diff_norm = np.linalg.norm(delta)
                 print(f'[K-Means] iteration: {i}/{self.max_iter}', end='')
                 print(f' - delta-centroid norm: {diff_norm}')
             self.centroids = new_centroids
-            
-        self.centroids = np.array(self.centroids)
+
         self._fitted = True
         return self
     
+    def _assign_block(self, X: Matrix) -> Matrix:
+        return np.argmin(_sqdist(X, self.centroids), axis=1)
+
     def predict(self, X: Matrix) -> Matrix:
         if not self._fitted: raise NotFittedError(self)
-        distances = np.linalg.norm(X[:, np.newaxis] - self.centroids, axis=2)
-        labels = np.argmin(distances, axis=1)
-        return labels
-    
+        return parallel_apply(self._assign_block, _as_float(X), self.n_jobs)
+
     @property
     def labels(self) -> Matrix:
         return self.predict(self._X)
-    
+
     def score(self, X: Matrix, metric: Evaluator = SilhouetteCoefficient) -> float:
         X_pred = self.predict(X)
         return metric.compute(X, X_pred)
 
-    def set_params(self, n_clusters: int = None, max_iter: int = None) -> None:
+    def set_params(self, n_clusters: int = None, max_iter: int = None,
+                   tol: float = None, n_jobs: int = None) -> None:
         if n_clusters is not None: self.n_clusters = int(n_clusters)
         if max_iter is not None: self.max_iter = int(max_iter)
+        if tol is not None: self.tol = float(tol)
+        if n_jobs is not None: self.n_jobs = int(n_jobs)
 
 
 class KMeansClusteringPlus(Estimator, Unsupervised):
@@ -110,38 +161,45 @@ class KMeansClusteringPlus(Estimator, Unsupervised):
         self._fitted = False
 
     def _initialize_centroids(self, X: Matrix) -> None:
-        self.centroids = [X[np.random.choice(X.shape[0])]]
+        n_samples = X.shape[0]
+        self.centroids = [X[np.random.choice(n_samples)]]
+
+        min_sqdist = np.full(n_samples, np.inf)
         for _ in range(1, self.n_clusters):
-            distances = [min([np.linalg.norm(x - c) ** 2 for c in self.centroids]) for x in X]
-            distances = np.array(distances)
-            
-            probs = distances / distances.sum()
-            next_centroid = np.random.choice(X.shape[0], p=probs)
+            sqdist = ((X - self.centroids[-1]) ** 2).sum(axis=1)
+            np.minimum(min_sqdist, sqdist, out=min_sqdist)
+
+            probs = min_sqdist / min_sqdist.sum()
+            next_centroid = np.random.choice(n_samples, p=probs)
             self.centroids.append(X[next_centroid])
         
     def fit(self, X: Matrix) -> 'KMeansClusteringPlus':
         self._X = X
+        X = _as_float(X)
         self._initialize_centroids(X)
-        
-        for _ in range(self.max_iter):
-            distances = np.linalg.norm(X[:, np.newaxis] - self.centroids, axis=2)
+
+        self.centroids = np.array(self.centroids, dtype=X.dtype)
+        X2 = (X * X).sum(axis=1)
+        for i in range(self.max_iter):
+            distances = _sqdist(X, self.centroids, X2)
             labels = np.argmin(distances, axis=1)
-            
-            for i in range(self.n_clusters):
-                cluster_points = X[labels == i]
-                if len(cluster_points) == 0: continue
-                self.centroids[i] = np.mean(cluster_points, axis=0)
-            
-            if self.verbose and i % 10 == 0: 
+
+            sums = np.zeros((self.n_clusters, X.shape[1]))
+            np.add.at(sums, labels, X)
+            counts = np.bincount(labels, minlength=self.n_clusters)
+
+            nonzero = counts > 0
+            self.centroids[nonzero] = sums[nonzero] / counts[nonzero, np.newaxis]
+
+            if self.verbose and i % 10 == 0:
                 print(f'[K-Means++] iteration: {i}/{self.max_iter}', end='')
-        
-        self.centroids = np.array(self.centroids)
+
         self._fitted = True
         return self
     
     def predict(self, X: Matrix) -> Matrix:
         if not self._fitted: raise NotFittedError(self)
-        distances = np.linalg.norm(X[:, np.newaxis] - self.centroids, axis=2)
+        distances = _sqdist(_as_float(X), self.centroids)
         labels = np.argmin(distances, axis=1)
         return labels
     
@@ -171,39 +229,51 @@ class KMediansClustering(Estimator, Unsupervised):
     ----------
     `n_clusters` : Number of clusters
     `max_iter` : Number of iteration
-    
+    `tol` : Relative tolerance on median movement for early stopping
+
     """
-    
-    def __init__(self, 
-                 n_clusters: int = None, 
+
+    def __init__(self,
+                 n_clusters: int = None,
                  max_iter: int = 100,
+                 tol: float = 1e-4,
                  verbose: bool = False) -> None:
         self.n_clusters = n_clusters
         self.max_iter = max_iter
+        self.tol = tol
         self.verbose = verbose
         self._X = None
         self._fitted = False
-        
+
     def fit(self, X: Matrix) -> 'KMediansClustering':
         self._X = X
+        X = _as_float(X)
         self.medians = X[np.random.choice(X.shape[0], self.n_clusters, replace=False)]
         
         for i in range(self.max_iter):
-            distances = np.abs(X[:, np.newaxis] - self.medians)
-            labels = np.argmin(distances.sum(axis=2), axis=1)
+            distances = _l1_dist_blocked(X, self.medians)
+            labels = np.argmin(distances, axis=1)
 
-            new_medians = [np.median(X[labels == i], axis=0) for i in range(self.n_clusters)]
-            new_medians = np.array(new_medians)
-            
-            if np.all(np.array(new_medians) == self.medians): 
+            order = np.argsort(labels, kind='stable')
+            bounds = np.searchsorted(labels[order], np.arange(self.n_clusters + 1))
+
+            X_sorted = X[order]
+            new_medians = np.array(self.medians, dtype=X.dtype)
+            for k in range(self.n_clusters):
+                lo, hi = bounds[k], bounds[k + 1]
+                if lo < hi: new_medians[k] = np.median(X_sorted[lo:hi], axis=0)
+
+            delta = new_medians - self.medians
+            if (delta * delta).sum() <= \
+                self.tol * self.tol * (self.medians * self.medians).sum():
                 if self.verbose: print(f'[K-Medians] Ealry convergence at itertaion {i}')
                 break
-            
-            if self.verbose and i % 10 == 0: 
-                diff_norm = np.linalg.norm(np.array(new_medians) - np.array(self.medians))
+
+            if self.verbose and i % 10 == 0:
+                diff_norm = np.linalg.norm(delta)
                 print(f'[K-Medians] iteration: {i}/{self.max_iter}', end='')
                 print(f' - delta-centroid norm: {diff_norm}')
-            
+
             self.medians = new_medians
         
         self._fitted = True
@@ -211,8 +281,8 @@ class KMediansClustering(Estimator, Unsupervised):
     
     def predict(self, X: Matrix) -> Matrix:
         if not self._fitted: raise NotFittedError(self)
-        distances = np.abs(X[:, np.newaxis] - self.medians)
-        labels = np.argmin(distances.sum(axis=2), axis=1)
+        distances = _l1_dist_blocked(_as_float(X), self.medians)
+        labels = np.argmin(distances, axis=1)
         return labels
     
     @property
@@ -223,9 +293,11 @@ class KMediansClustering(Estimator, Unsupervised):
         X_pred = self.predict(X)
         return metric.compute(X, X_pred)
     
-    def set_params(self, n_clusters: int = None, max_iter: int = None) -> None:
+    def set_params(self, n_clusters: int = None,
+                   max_iter: int = None, tol: float = None) -> None:
         if n_clusters is not None: self.n_clusters = int(n_clusters)
         if max_iter is not None: self.max_iter = int(max_iter)
+        if tol is not None: self.tol = float(tol)
 
 
 class MiniBatchKMeansClustering(Estimator, Unsupervised):
@@ -261,28 +333,37 @@ class MiniBatchKMeansClustering(Estimator, Unsupervised):
     def fit(self, X: Matrix) -> 'MiniBatchKMeansClustering':
         m, _ = X.shape
         self._X = X
-        
+        X = _as_float(X)
+
         rand_idx = np.random.choice(m, self.n_clusters, replace=False)
         self.centroids = X[rand_idx]
+        self._counts = np.zeros(self.n_clusters)
 
         for _ in range(self.max_iter):
             batch_idx = np.random.choice(m, self.batch_size, replace=False)
             batch = X[batch_idx]
-            
-            distances = np.linalg.norm(batch[:, np.newaxis] - self.centroids, axis=2)
+
+            distances = _sqdist(batch, self.centroids)
             closest_cluster_idx = np.argmin(distances, axis=1)
-            
-            for i in range(self.n_clusters):
-                cluster_points = batch[closest_cluster_idx == i]
-                if len(cluster_points) > 0:
-                    self.centroids[i] = np.mean(cluster_points, axis=0)
+
+            sums = np.zeros((self.n_clusters, X.shape[1]))
+            np.add.at(sums, closest_cluster_idx, batch)
+            counts = np.bincount(closest_cluster_idx, minlength=self.n_clusters)
+
+            nonzero = counts > 0
+            self._counts += counts
+            batch_means = sums[nonzero] / counts[nonzero, np.newaxis]
+
+            eta = (counts[nonzero] / self._counts[nonzero])[:, np.newaxis]
+            self.centroids[nonzero] *= 1 - eta
+            self.centroids[nonzero] += eta * batch_means
         
         self._fitted = True
         return self
 
     def predict(self, X: Matrix) -> Matrix:
         if not self._fitted: raise NotFittedError(self)
-        distances = np.linalg.norm(X[:, np.newaxis] - self.centroids, axis=2)
+        distances = _sqdist(_as_float(X), self.centroids)
         return np.argmin(distances, axis=1)
     
     @property
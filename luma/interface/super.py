@@ -1,5 +1,6 @@
 from abc import *
-from typing import Any
+from typing import Any, Iterable, Iterator
+import numpy as np
 
 from luma.core.main import LUMA
 
@@ -36,16 +37,45 @@ class Estimator(LUMA, metaclass=ABCMeta):
     
     @abstractmethod
     def fit(self, *args) -> 'Estimator': ...
-    
+
     @abstractmethod
     def predict(self, *args) -> Any: ...
-    
+
     @abstractmethod
     def score(self, *args) -> float: ...
-    
+
     @abstractmethod
     def set_params(self, *args) -> None: ...
 
+    def predict_batched(self, X_iter: Iterable,
+                        batch_size: int = 1024) -> Iterator:
+
+        """
+        Consume a stream of samples and yield predictions one batch at
+        a time, reusing a single preallocated buffer. Batching amortizes
+        per-call overhead over many samples, so larger `batch_size`
+        raises throughput at the cost of the latency to fill a batch.
+
+        Example
+        -------
+        >>> for batch_pred in model.predict_batched(sample_stream):
+        >>>     handle(batch_pred)
+
+        """
+
+        buffer, filled = None, 0
+        for x in X_iter:
+            x = np.asarray(x)
+            if buffer is None:
+                buffer = np.empty((batch_size, *x.shape), dtype=x.dtype)
+            buffer[filled] = x
+            filled += 1
+            if filled == batch_size:
+                yield self.predict(buffer)
+                filled = 0
+
+        if filled: yield self.predict(buffer[:filled])
+
 
 class Transformer(LUMA, metaclass=ABCMeta):
     
@@ -1,13 +1,20 @@
-from typing import Any
+from typing import Any, Callable
 import numpy as np
 
+try:
+    from joblib import Parallel, delayed
+    JOBLIB_AVAILABLE = True
+except ImportError:
+    JOBLIB_AVAILABLE = False
+
 
 __all__ = (
-    'Matrix', 
-    'TreeNode', 
-    'NearestNeighbors', 
-    'SilhouetteUtil', 
-    'DBUtil'
+    'Matrix',
+    'TreeNode',
+    'NearestNeighbors',
+    'SilhouetteUtil',
+    'DBUtil',
+    'parallel_apply'
 )
 
 
@@ -16,26 +23,45 @@ class Matrix(np.ndarray):
     """
     Internal class that extends numpy.ndarray.
 
-    This class provides a way to create matrix objects that have 
-    all the capabilities of numpy arrays with the potential for 
+    This class provides a way to create matrix objects that have
+    all the capabilities of numpy arrays with the potential for
     additional functionalities and readability.s
-    
+
     Example
     -------
     >>> m = Matrix([1, 2, 3])
     >>> isinstance(m, numpy.ndarray) # True
-    
+    >>> isinstance(m, Matrix) # True
+
     """
-    
-    def __new__(cls, array_like: Any) -> 'Matrix':
-        if isinstance(array_like, list): obj = np.array(array_like)
-        else: obj = array_like    
-        return obj
+
+    def __new__(cls, array_like: Any,
+                dtype: Any = None, order: str = None) -> 'Matrix':
+        return np.asarray(array_like, dtype=dtype, order=order).view(cls)
 
     def __array_finalize__(self, obj: np.ndarray | None) -> None:
         if obj is None: return
 
 
+def parallel_apply(func: Callable, X: Matrix, n_jobs: int) -> Matrix:
+
+    """
+    Internal function that maps a row-wise vectorized kernel over
+    blocks of `X` with joblib's threading backend and concatenates
+    the per-block results. Runs serially when `n_jobs` is `None`
+    or 1, when joblib is unavailable, or when `X` has fewer rows
+    than workers.
+    """
+
+    if n_jobs in (None, 1) or not JOBLIB_AVAILABLE or X.shape[0] < n_jobs:
+        return func(X)
+
+    blocks = np.array_split(X, n_jobs)
+    results = Parallel(n_jobs=n_jobs, prefer='threads')(
+        delayed(func)(block) for block in blocks)
+    return np.concatenate(results)
+
+
 class TreeNode:
     
     """
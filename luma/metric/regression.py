@@ -52,11 +52,18 @@ class RSquaredScore(Evaluator):
 class Complex:
     @staticmethod
     def compute(y_true: Matrix, y_pred: Matrix) -> dict:
+        diff = y_true - y_pred
+        abs_diff = np.abs(diff)
+        sq_diff = diff * diff
+
         scores = dict()
-        scores['mae'] = MeanAbsoluteError.compute(y_true, y_pred)
-        scores['mse'] = MeanSquaredError.compute(y_true, y_pred)
-        scores['rmse'] = RootMeanSquaredError.compute(y_true, y_pred)
-        scores['mape'] = MeanAbsolutePercentageError.compute(y_true, y_pred)
-        scores['rsqe'] = RSquaredScore.compute(y_true, y_pred)
+        scores['mae'] = np.mean(abs_diff)
+        scores['mse'] = np.mean(sq_diff)
+        scores['rmse'] = np.sqrt(scores['mse'])
+        scores['mape'] = np.mean(abs_diff / np.abs(y_true)) * 100
+
+        y_bar = np.mean(y_true)
+        total_sum_of_squares = np.sum((y_true - y_bar) ** 2)
+        scores['rsqe'] = 1 - np.sum(sq_diff) / total_sum_of_squares
         return scores
 
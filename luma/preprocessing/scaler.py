@@ -24,8 +24,10 @@ class StandardScaler(Transformer, Transformer.Feature):
         self._fitted = False
 
     def fit(self, X: Matrix) -> 'StandardScaler':
-        self.mean = np.mean(X, axis=0)
-        self.std = np.std(X, axis=0)
+        n_samples = X.shape[0]
+        s1, s2 = X.sum(axis=0), (X * X).sum(axis=0)
+        self.mean = s1 / n_samples
+        self.std = np.sqrt(np.maximum(s2 / n_samples - self.mean ** 2, 0))
         self._fitted = True
         return self
 
@@ -35,7 +37,9 @@ class StandardScaler(Transformer, Transformer.Feature):
 
     def fit_transform(self, X: Matrix) -> Matrix:
         self.fit(X)
-        return self.transform(X)
+        scaled = X - self.mean
+        scaled /= self.std
+        return scaled
 
     def inverse_transform(self, X: Matrix) -> Matrix:
         if not self._fitted: raise NotFittedError(self)
@@ -65,8 +69,8 @@ class MinMaxScaler(Transformer, Transformer.Feature):
         self._fitted = False
 
     def fit(self, X: Matrix) -> 'MinMaxScaler':
-        self.min = np.min(X, axis=0)
-        self.max = np.max(X, axis=0)
+        self.min = np.minimum.reduce(X, axis=0)
+        self.max = np.maximum.reduce(X, axis=0)
         self._fitted = True
         return self
 
@@ -78,7 +82,10 @@ class MinMaxScaler(Transformer, Transformer.Feature):
 
     def fit_transform(self, X: Matrix) -> Matrix:
         self.fit(X)
-        return self.transform(X)
+        min_val, max_val = self.feature_range
+        scaled = (X - self.min) * ((max_val - min_val) / (self.max - self.min))
+        scaled += min_val
+        return scaled
 
     def inverse_transform(self, X: Matrix) -> Matrix:
         if not self._fitted: raise NotFittedError(self)